@@ -10,11 +10,9 @@
 
 import { createClient } from '@supabase/supabase-js'
 import dotenv from 'dotenv'
-import path from 'path'
-import { fileURLToPath } from 'url'
+import { ENV_PATH } from '../src/config/paths.js'
 
-const __dirname = path.dirname(fileURLToPath(import.meta.url))
-dotenv.config({ path: path.resolve(__dirname, '..', '.env') })
+dotenv.config({ path: ENV_PATH })
 
 const SUPABASE_URL = process.env.SUPABASE_URL
 const SUPABASE_SERVICE_KEY = process.env.SUPABASE_SERVICE_ROLE_KEY
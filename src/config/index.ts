@@ -1,10 +1,5 @@
 import dotenv from 'dotenv'
-import path from 'path'
-import { fileURLToPath } from 'url'
-
-const __dirname = path.dirname(fileURLToPath(import.meta.url))
-export const ENV_PATH = path.resolve(__dirname, '..', '..', '.env')
-export const ENV_EXAMPLE_PATH = path.resolve(__dirname, '..', '..', '.env.example')
+import { ENV_PATH } from './paths.js'
 
 dotenv.config({ path: ENV_PATH })
 
@@ -25,6 +20,7 @@ export interface ScraperConfig {
 
   // Concurrency
   maxConcurrentScrapers: number
+  maxConcurrentPosts: number
 }
 
 function getEnvVar(name: string): string {
@@ -62,6 +58,7 @@ function loadConfigFromEnv(): ScraperConfig {
 
     // Concurrency
     maxConcurrentScrapers: getEnvInt('MAX_CONCURRENT_SCRAPERS', 3),
+    maxConcurrentPosts: Math.max(1, getEnvInt('MAX_CONCURRENT_POSTS', 3)),
   }
 }
 
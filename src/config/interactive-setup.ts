@@ -1,13 +1,11 @@
 import dotenv from 'dotenv'
 import { existsSync } from 'fs'
 import { readFile, writeFile } from 'fs/promises'
-import path from 'path'
-import readline from 'readline/promises'
-import { stdin as input, stdout as output } from 'process'
-import { ENV_EXAMPLE_PATH, ENV_PATH, config, getMissingRequiredConfig, reloadConfig } from './index.js'
+import type { Interface as ReadlineInterface } from 'readline/promises'
+import { config, getMissingRequiredConfig, reloadConfig } from './index.js'
+import { ENV_EXAMPLE_PATH, ENV_PATH } from './paths.js'
 
 type EnvMap = Record<string, string>
-type ReadlineInterface = ReturnType<typeof readline.createInterface>
 
 interface EnsureConfigOptions {
   force?: boolean
@@ -110,7 +108,9 @@ export async function ensureConfigInteractive(options: EnsureConfigOptions = {})
 
   const values: EnvMap = { ...existingValues }
 
-  const rl = readline.createInterface({ input, output })
+  // Only load readline once we know we have to prompt
+  const readline = await import('readline/promises')
+  const rl = readline.createInterface({ input: process.stdin, output: process.stdout })
 
   values.GEMINI_API_KEY = await askValue(
     rl,
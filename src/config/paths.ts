@@ -0,0 +1,6 @@
+import path from 'path'
+import { fileURLToPath } from 'url'
+
+export const PROJECT_ROOT = fileURLToPath(new URL('../..', import.meta.url))
+export const ENV_PATH = path.join(PROJECT_ROOT, '.env')
+export const ENV_EXAMPLE_PATH = path.join(PROJECT_ROOT, '.env.example')
@@ -49,3 +49,21 @@ export const ROBOTAXI_KEYWORDS = [
   'autopilot',
   'tesla autonomy',
 ] as const
+
+// Lowercased keywords with redundant entries removed. A keyword that contains
+// a shorter keyword (e.g. 'tesla robotaxi' contains 'tesla') can never change
+// the result of a substring match, so only the shortest forms are kept.
+export const ROBOTAXI_KEYWORDS_NORMALIZED: readonly string[] = Array.from(
+  new Set(ROBOTAXI_KEYWORDS.map(keyword => keyword.toLowerCase()))
+).filter((keyword, _index, keywords) =>
+  !keywords.some(other => other !== keyword && keyword.includes(other))
+)
+
+// Single case-insensitive alternation over the normalized keywords, so each
+// post is scanned once instead of once per keyword
+export const ROBOTAXI_KEYWORD_PATTERN = new RegExp(
+  ROBOTAXI_KEYWORDS_NORMALIZED
+    .map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+    .join('|'),
+  'i'
+)
@@ -52,9 +52,10 @@ export async function pendingSubmissionExists(
     .eq('plate_number', plateNumber)
     .eq('provider', provider)
     .eq('status', 'pending')
-    .single()
+    .limit(1)
+    .maybeSingle()
 
-  if (error && error.code !== 'PGRST116') {
+  if (error) {
     logger.error({ error, plateNumber, provider }, 'Error checking pending submissions')
   }
 
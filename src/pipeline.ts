@@ -0,0 +1,292 @@
+import pLimit from 'p-limit'
+import { config } from './config/index.js'
+import { logger } from './utils/logger.js'
+import { scraperRegistry } from './scrapers/registry.js'
+import { RedditScraper } from './scrapers/reddit.js'
+import type { ScrapedPost } from './scrapers/types.js'
+import { detectRobotaxi } from './vision/detector.js'
+import { extractPlate } from './vision/plate-extractor.js'
+import { GeminiRateLimitError } from './vision/gemini.js'
+import { isPostProcessed, markPostProcessed } from './database/tracking.js'
+import { plateExistsInFleet, pendingSubmissionExists, createSubmission } from './database/submissions.js'
+import { uploadScrapedImage } from './storage/uploader.js'
+import { downloadImage } from './scrapers/http.js'
+import { delay } from './utils/delay.js'
+import type { VehicleProvider } from './utils/validation.js'
+
+const MIN_DETECTION_CONFIDENCE = 70
+const MIN_PLATE_CONFIDENCE = 60
+
+// Posts are analyzed concurrently, but the fleet/pending checks and the insert
+// must not interleave or two posts with the same plate both get submitted
+const submissionLimit = pLimit(1)
+
+interface PlateCandidate {
+  imageUrl: string
+  plateNumber: string
+  provider: VehicleProvider
+  plateConfidence: number
+  detectionConfidence: number
+  imageBuffer?: Buffer
+}
+
+export function registerScrapers(): void {
+  logger.info('Registering scrapers...')
+
+  scraperRegistry.register(new RedditScraper(), {
+    enabled: config.enableReddit,
+    priority: 10,
+  })
+
+  const allHealth = scraperRegistry.getAllHealth()
+  const enabledCount = allHealth.filter(h => h.enabled).length
+
+  logger.info({
+    total: allHealth.length,
+    enabled: enabledCount,
+    scrapers: allHealth.filter(h => h.enabled).map(h => h.name),
+  }, 'Scrapers registered')
+}
+
+async function processPost(post: ScrapedPost): Promise<void> {
+  logger.info({
+    source: post.source,
+    sourceId: post.sourceId,
+    title: post.title.slice(0, 50),
+    imageCount: post.imageUrls.length,
+  }, 'Processing post')
+
+  let bestCandidate: PlateCandidate | null = null
+  let sawRobotaxi = false
+
+  for (const imageUrl of post.imageUrls) {
+    const detection = await detectRobotaxi(imageUrl)
+
+    if (!detection.isRobotaxi || !detection.provider) {
+      logger.debug({ imageUrl, detection }, 'Not a robotaxi')
+      continue
+    }
+
+    if (detection.confidence < MIN_DETECTION_CONFIDENCE) {
+      logger.debug({ imageUrl, confidence: detection.confidence }, 'Detection confidence too low')
+      continue
+    }
+
+    sawRobotaxi = true
+
+    logger.info({
+      imageUrl,
+      provider: detection.provider,
+      confidence: detection.confidence,
+    }, 'Robotaxi detected')
+
+    const plateResult = await extractPlate(imageUrl, detection.provider)
+
+    if (!plateResult.found || !plateResult.plateNumber) {
+      logger.info({ imageUrl }, 'No plate found')
+      continue
+    }
+
+    if (plateResult.confidence < MIN_PLATE_CONFIDENCE) {
+      logger.info({
+        plate: plateResult.plateNumber,
+        confidence: plateResult.confidence,
+      }, 'Plate confidence too low')
+      continue
+    }
+
+    const candidate: PlateCandidate = {
+      imageUrl,
+      plateNumber: plateResult.plateNumber,
+      provider: detection.provider,
+      plateConfidence: plateResult.confidence,
+      detectionConfidence: detection.confidence,
+    }
+
+    if (
+      !bestCandidate ||
+      candidate.plateConfidence > bestCandidate.plateConfidence ||
+      (
+        candidate.plateConfidence === bestCandidate.plateConfidence &&
+        candidate.detectionConfidence > bestCandidate.detectionConfidence
+      )
+    ) {
+      // Hold on to the image (a cache hit right after extraction) so the
+      // upload doesn't depend on it surviving in the download cache
+      candidate.imageBuffer = await downloadImage(imageUrl).catch(() => undefined)
+      bestCandidate = candidate
+    }
+
+    await delay(1000)
+  }
+
+  if (!sawRobotaxi) {
+    await markPostProcessed({
+      source: post.source,
+      sourceId: post.sourceId,
+      sourceUrl: post.sourceUrl,
+      result: 'not_robotaxi',
+    })
+    return
+  }
+
+  if (!bestCandidate) {
+    await markPostProcessed({
+      source: post.source,
+      sourceId: post.sourceId,
+      sourceUrl: post.sourceUrl,
+      result: 'no_plate',
+    })
+    return
+  }
+
+  const candidate = bestCandidate
+  await submissionLimit(() => submitCandidate(post, candidate))
+}
+
+async function submitCandidate(post: ScrapedPost, bestCandidate: PlateCandidate): Promise<void> {
+  const plateNumber = bestCandidate.plateNumber
+  const provider = bestCandidate.provider
+
+  if (await plateExistsInFleet(plateNumber, provider)) {
+    logger.info({ plate: plateNumber }, 'Plate already in fleet')
+    await markPostProcessed({
+      source: post.source,
+      sourceId: post.sourceId,
+      sourceUrl: post.sourceUrl,
+      result: 'duplicate',
+    })
+    return
+  }
+
+  if (await pendingSubmissionExists(plateNumber, provider)) {
+    logger.info({ plate: plateNumber }, 'Pending submission already exists')
+    await markPostProcessed({
+      source: post.source,
+      sourceId: post.sourceId,
+      sourceUrl: post.sourceUrl,
+      result: 'duplicate',
+    })
+    return
+  }
+
+  const uploadResult = await uploadScrapedImage(bestCandidate.imageUrl, plateNumber, bestCandidate.imageBuffer)
+
+  if (!uploadResult.success || !uploadResult.publicUrl) {
+    logger.error({ imageUrl: bestCandidate.imageUrl, error: uploadResult.error }, 'Failed to upload image')
+    await markPostProcessed({
+      source: post.source,
+      sourceId: post.sourceId,
+      sourceUrl: post.sourceUrl,
+      result: 'error',
+      errorMessage: `Upload failed: ${uploadResult.error}`,
+    })
+    return
+  }
+
+  const submissionResult = await createSubmission({
+    plateNumber,
+    provider,
+    imageUrls: [uploadResult.publicUrl],
+    sourceUrl: post.sourceUrl,
+    source: post.source,
+  })
+
+  if (!submissionResult.success) {
+    logger.error({ error: submissionResult.error }, 'Failed to create submission')
+    await markPostProcessed({
+      source: post.source,
+      sourceId: post.sourceId,
+      sourceUrl: post.sourceUrl,
+      result: 'error',
+      errorMessage: submissionResult.error,
+    })
+    return
+  }
+
+  logger.info({
+    plate: plateNumber,
+    provider,
+    submissionId: submissionResult.submissionId,
+  }, 'Created submission successfully')
+
+  await markPostProcessed({
+    source: post.source,
+    sourceId: post.sourceId,
+    sourceUrl: post.sourceUrl,
+    result: 'submitted',
+    submissionId: submissionResult.submissionId,
+  })
+}
+
+export async function runScrapeJob(): Promise<void> {
+  const startTime = Date.now()
+  const since = new Date(Date.now() - config.lookbackHours * 60 * 60 * 1000)
+
+  logger.info({ since: since.toISOString() }, 'Starting scrape job')
+
+  const allPosts = await scraperRegistry.runAll(since, config.maxConcurrentScrapers)
+
+  logger.info({ totalPosts: allPosts.length }, 'Total posts collected')
+
+  let processed = 0
+  let skipped = 0
+  const deferredPosts: string[] = []
+  // Set once Gemini is still rate limited after retries (or the quota is
+  // exhausted); remaining posts are left unmarked for the next run
+  let rateLimited = false
+  const limit = pLimit(config.maxConcurrentPosts)
+
+  await Promise.all(allPosts.map(post => limit(async () => {
+    if (rateLimited) {
+      deferredPosts.push(post.sourceId)
+      return
+    }
+
+    if (await isPostProcessed(post.source, post.sourceId)) {
+      skipped++
+      return
+    }
+
+    try {
+      await processPost(post)
+      processed++
+    } catch (error) {
+      if (error instanceof GeminiRateLimitError) {
+        deferredPosts.push(post.sourceId)
+        if (!rateLimited) {
+          rateLimited = true
+          logger.warn(
+            { post: post.sourceId, quotaExhausted: error.quotaExhausted },
+            'Gemini rate limited, deferring remaining posts to the next run'
+          )
+        }
+        return
+      }
+      logger.error({ error, post: post.sourceId }, 'Failed to process post')
+      await markPostProcessed({
+        source: post.source,
+        sourceId: post.sourceId,
+        sourceUrl: post.sourceUrl,
+        result: 'error',
+        errorMessage: error instanceof Error ? error.message : 'Unknown error',
+      })
+    }
+
+    await delay(2000)
+  })))
+
+  const duration = Math.round((Date.now() - startTime) / 1000)
+  logger.info({
+    duration: `${duration}s`,
+    totalPosts: allPosts.length,
+    processed,
+    skipped,
+    deferred: deferredPosts.length,
+  }, 'Scrape job completed')
+
+  if (deferredPosts.length > 0) {
+    // Deferred posts older than the lookback window won't be collected again
+    logger.warn({ posts: deferredPosts }, 'Posts deferred by Gemini rate limit')
+  }
+}
@@ -147,7 +147,38 @@ export async function fetchHtml(url: string, options: FetchOptions = {}): Promis
   return response.text()
 }
 
-export async function downloadImage(url: string): Promise<Buffer> {
+const MAX_CACHED_IMAGES = 10
+
+// Recently downloaded images keyed by URL. Detection and plate extraction
+// read the same image back to back, so it is only fetched once. The pipeline
+// keeps the chosen image's buffer itself for the upload.
+const imageCache = new Map<string, Promise<Buffer>>()
+
+export function downloadImage(url: string): Promise<Buffer> {
+  const cached = imageCache.get(url)
+  if (cached) {
+    return cached
+  }
+
+  const pending = fetchImage(url)
+  imageCache.set(url, pending)
+  pending.catch(() => {
+    if (imageCache.get(url) === pending) {
+      imageCache.delete(url)
+    }
+  })
+
+  if (imageCache.size > MAX_CACHED_IMAGES) {
+    const oldestUrl = imageCache.keys().next().value
+    if (oldestUrl !== undefined) {
+      imageCache.delete(oldestUrl)
+    }
+  }
+
+  return pending
+}
+
+async function fetchImage(url: string): Promise<Buffer> {
   const response = await fetchWithRetry(url, {
     headers: {
       'Accept': 'image/*',
@@ -3,7 +3,7 @@ import { fetchWithRetry } from './http.js'
 import { config } from '../config/index.js'
 import { logger } from '../utils/logger.js'
 import { delay } from '../utils/delay.js'
-import { TARGET_SUBREDDITS, ROBOTAXI_KEYWORDS, ROBOTAXI_SUBREDDITS } from '../config/search-terms.js'
+import { TARGET_SUBREDDITS, ROBOTAXI_KEYWORD_PATTERN, ROBOTAXI_SUBREDDITS } from '../config/search-terms.js'
 import type { ScrapedPost, Scraper } from './types.js'
 
 const REDDIT_RSS_BASE_URLS = [
@@ -11,6 +11,17 @@ const REDDIT_RSS_BASE_URLS = [
   'https://old.reddit.com',
 ]
 const REDDIT_RSS_ACCEPT_HEADER = 'application/rss+xml, application/xml;q=0.9, */*;q=0.8'
+const REDDIT_RSS_LIMIT = 100
+
+// Subreddits fetched together through a combined /r/a+b+c feed
+const SUBREDDITS_PER_REQUEST = 6
+
+// Reddit fullname prefix for posts (links)
+const POST_FULLNAME_PREFIX = 't3_'
+const POST_ID_PATTERN = /comments\/([a-z0-9]+)/i
+const SUBREDDIT_PATTERN = /\/r\/([^/?#]+)/i
+
+const ROBOTAXI_SUBREDDITS_LOWER = new Set(Array.from(ROBOTAXI_SUBREDDITS, name => name.toLowerCase()))
 
 const RSS_PARSER = new XMLParser({
   ignoreAttributes: false,
@@ -97,10 +108,26 @@ function getAuthorName(item: RedditRssItem): string {
   return ''
 }
 
+function getContentHtml(item: RedditRssItem): string {
+  return getTextValue(item['content:encoded']) || getTextValue(item.content) || getTextValue(item.description)
+}
+
 function stripHtml(html: string): string {
   return decodeHtmlEntities(html.replace(/<[^>]*>/g, ' ')).replace(/\s+/g, ' ').trim()
 }
 
+function isDirectImageUrl(url: string): boolean {
+  const lower = url.toLowerCase()
+  return (
+    lower.includes('i.redd.it') ||
+    lower.includes('i.imgur.com') ||
+    lower.endsWith('.jpg') ||
+    lower.endsWith('.jpeg') ||
+    lower.endsWith('.png') ||
+    lower.endsWith('.webp')
+  )
+}
+
 function extractImageUrlsFromHtml(html: string): string[] {
   const urls = new Set<string>()
   if (!html) return []
@@ -116,15 +143,7 @@ function extractImageUrlsFromHtml(html: string): string[] {
 
   while ((match = linkRegex.exec(decoded)) !== null) {
     const url = match[1]
-    const lower = url.toLowerCase()
-    if (
-      lower.includes('i.redd.it') ||
-      lower.includes('i.imgur.com') ||
-      lower.endsWith('.jpg') ||
-      lower.endsWith('.jpeg') ||
-      lower.endsWith('.png') ||
-      lower.endsWith('.webp')
-    ) {
+    if (isDirectImageUrl(url)) {
       urls.add(url)
     }
   }
@@ -132,71 +151,73 @@ function extractImageUrlsFromHtml(html: string): string[] {
   return Array.from(urls)
 }
 
-function extractImageUrlsFromItem(item: RedditRssItem): string[] {
-  const content = getTextValue(item['content:encoded']) || getTextValue(item.content) || getTextValue(item.description)
-  const urls = new Set(extractImageUrlsFromHtml(content))
-  const link = getLinkValue(item.link)
-  if (link) {
-    const lower = link.toLowerCase()
-    if (
-      lower.includes('i.redd.it') ||
-      lower.includes('i.imgur.com') ||
-      lower.endsWith('.jpg') ||
-      lower.endsWith('.jpeg') ||
-      lower.endsWith('.png') ||
-      lower.endsWith('.webp')
-    ) {
-      urls.add(link)
-    }
+function extractImageUrlsFromItem(link: string, contentHtml: string): string[] {
+  const urls = new Set(extractImageUrlsFromHtml(contentHtml))
+  if (link && isDirectImageUrl(link)) {
+    urls.add(link)
   }
 
   return Array.from(urls)
 }
 
 function containsRobotaxiKeywords(text: string): boolean {
-  const normalized = text.toLowerCase()
-  return ROBOTAXI_KEYWORDS.some(keyword => normalized.includes(keyword.toLowerCase()))
+  return ROBOTAXI_KEYWORD_PATTERN.test(text)
 }
 
 function extractSubreddit(link: string): string {
-  try {
-    const url = new URL(link)
-    const parts = url.pathname.split('/').filter(Boolean)
-    const subredditIndex = parts.findIndex(part => part.toLowerCase() === 'r')
-    if (subredditIndex >= 0 && parts[subredditIndex + 1]) {
-      return parts[subredditIndex + 1]
-    }
-  } catch {
-    // ignore invalid URLs
-  }
-  return 'reddit'
+  const match = SUBREDDIT_PATTERN.exec(link)
+  return match ? match[1] : 'reddit'
 }
 
 function extractPostId(guid: string, link: string): string {
   const guidText = guid.trim()
-  if (guidText.startsWith('t3_')) {
-    return guidText.slice(3)
+  if (guidText.startsWith(POST_FULLNAME_PREFIX)) {
+    return guidText.slice(POST_FULLNAME_PREFIX.length)
   }
-  const match = /comments\/([a-z0-9]+)/i.exec(link)
+  const match = POST_ID_PATTERN.exec(link)
   if (match) {
     return match[1]
   }
   return guidText || link
 }
 
-function toScrapedPost(item: RedditRssItem): ScrapedPost | null {
+// Publication time in epoch milliseconds, or null if missing or unparseable
+function getPublishedTime(item: RedditRssItem): number | null {
+  const pubDateText = getTextValue(item.pubDate) || getTextValue(item.published) || getTextValue(item.updated)
+  if (!pubDateText) return null
+  const time = Date.parse(pubDateText)
+  return Number.isNaN(time) ? null : time
+}
+
+// Item fields read once and shared between filtering and conversion
+interface RedditItemContent {
+  link: string
+  subreddit: string
+  title: string
+  contentHtml: string
+  text: string
+}
+
+function readItemContent(item: RedditRssItem): RedditItemContent {
+  const contentHtml = getContentHtml(item)
   const link = getLinkValue(item.link)
-  const title = getTextValue(item.title)
-  const contentHtml = getTextValue(item['content:encoded']) || getTextValue(item.content) || getTextValue(item.description)
-  const text = stripHtml(contentHtml)
-  const imageUrls = extractImageUrlsFromItem(item)
+  return {
+    link,
+    subreddit: extractSubreddit(link),
+    title: getTextValue(item.title),
+    contentHtml,
+    text: stripHtml(contentHtml),
+  }
+}
+
+function toScrapedPost(item: RedditRssItem, content: RedditItemContent, publishedTime: number): ScrapedPost | null {
+  const { link, subreddit, title, text } = content
+  const imageUrls = extractImageUrlsFromItem(link, content.contentHtml)
 
   if (!link || imageUrls.length === 0) {
     return null
   }
 
-  const pubDateText = getTextValue(item.pubDate) || getTextValue(item.published) || getTextValue(item.updated)
-  const createdAt = pubDateText ? new Date(pubDateText) : new Date()
   const guid = getTextValue(item.guid)
 
   return {
@@ -207,8 +228,8 @@ function toScrapedPost(item: RedditRssItem): ScrapedPost | null {
     title,
     text,
     imageUrls,
-    createdAt,
-    subreddit: extractSubreddit(link),
+    createdAt: new Date(publishedTime),
+    subreddit,
   }
 }
 
@@ -265,27 +286,28 @@ export class RedditScraper implements Scraper {
 
   async scrape(since: Date): Promise<ScrapedPost[]> {
     const posts: ScrapedPost[] = []
-    const sinceTimestamp = since.getTime() / 1000
+    const sinceTime = since.getTime()
 
     logger.info({ since: since.toISOString() }, 'Starting Reddit scrape')
 
-    // Scrape each target subreddit
-    for (const subreddit of TARGET_SUBREDDITS) {
+    // Scrape target subreddits in combined batches
+    for (let i = 0; i < TARGET_SUBREDDITS.length; i += SUBREDDITS_PER_REQUEST) {
+      const subreddits = TARGET_SUBREDDITS.slice(i, i + SUBREDDITS_PER_REQUEST)
       try {
-        const subredditPosts = await this.scrapeSubreddit(subreddit, sinceTimestamp)
+        const subredditPosts = await this.scrapeSubreddits(subreddits, sinceTime)
         posts.push(...subredditPosts)
-        logger.info({ subreddit, count: subredditPosts.length }, 'Scraped subreddit')
+        logger.info({ subreddits, count: subredditPosts.length }, 'Scraped subreddits')
 
-        // Delay between subreddits to avoid rate limiting
+        // Delay between requests to avoid rate limiting
         await delay(2000)
       } catch (error) {
-        logger.error({ subreddit, err: error }, 'Failed to scrape subreddit')
+        logger.error({ subreddits, err: error }, 'Failed to scrape subreddits')
       }
     }
 
     // Also search across all of Reddit for robotaxi keywords
     try {
-      const searchPosts = await this.searchReddit('robotaxi OR waymo OR cybercab', sinceTimestamp)
+      const searchPosts = await this.searchReddit('robotaxi OR waymo OR cybercab', sinceTime)
 
       // Dedupe by post ID
       const existingIds = new Set(posts.map(p => p.sourceId))
@@ -303,34 +325,46 @@ export class RedditScraper implements Scraper {
     return posts
   }
 
-  private async scrapeSubreddit(subreddit: string, sinceTimestamp: number): Promise<ScrapedPost[]> {
+  private async scrapeSubreddits(subreddits: readonly string[], sinceTime: number): Promise<ScrapedPost[]> {
     const posts: ScrapedPost[] = []
-    const path = `/r/${subreddit}/new.rss?limit=100`
+    const path = `/r/${subreddits.join('+')}/new.rss?limit=${REDDIT_RSS_LIMIT}`
     const items = await fetchRedditRss(path)
 
+    // A full page that never reaches `since` means busy subreddits crowded out
+    // older posts, so fall back to fetching each subreddit on its own
+    if (subreddits.length > 1 && items.length >= REDDIT_RSS_LIMIT) {
+      const oldestTime = getPublishedTime(items[items.length - 1])
+      if (oldestTime !== null && oldestTime >= sinceTime) {
+        logger.info({ subreddits }, 'Combined feed truncated, fetching subreddits individually')
+        for (const subreddit of subreddits) {
+          try {
+            posts.push(...await this.scrapeSubreddits([subreddit], sinceTime))
+          } catch (error) {
+            logger.error({ subreddit, err: error }, 'Failed to scrape subreddit')
+          }
+          await delay(2000)
+        }
+        return posts
+      }
+    }
+
     for (const item of items) {
-      const link = getLinkValue(item.link)
-      const contentHtml = getTextValue(item['content:encoded']) || getTextValue(item.content) || getTextValue(item.description)
-      const text = stripHtml(`${getTextValue(item.title)} ${contentHtml}`)
-      const pubDateText = getTextValue(item.pubDate) || getTextValue(item.published) || getTextValue(item.updated)
-      const createdAt = pubDateText ? new Date(pubDateText) : null
+      const publishedTime = getPublishedTime(item)
 
-      if (!createdAt) {
+      // Skip undated posts and posts older than since
+      if (publishedTime === null || publishedTime < sinceTime) {
         continue
       }
 
-      // Skip posts older than since
-      if (createdAt.getTime() / 1000 < sinceTimestamp) {
-        continue
-      }
+      const content = readItemContent(item)
 
       // Only include posts with robotaxi keywords in target subreddits that aren't robotaxi-specific
-      const isRobotaxiSubreddit = ROBOTAXI_SUBREDDITS.has(subreddit)
-      if (!isRobotaxiSubreddit && !containsRobotaxiKeywords(text)) {
+      const isRobotaxiSubreddit = ROBOTAXI_SUBREDDITS_LOWER.has(content.subreddit.toLowerCase())
+      if (!isRobotaxiSubreddit && !containsRobotaxiKeywords(`${content.title} ${content.text}`)) {
         continue
       }
 
-      const scrapedPost = toScrapedPost(item)
+      const scrapedPost = toScrapedPost(item, content, publishedTime)
       if (scrapedPost) {
         posts.push(scrapedPost)
       }
@@ -339,26 +373,21 @@ export class RedditScraper implements Scraper {
     return posts
   }
 
-  private async searchReddit(query: string, sinceTimestamp: number): Promise<ScrapedPost[]> {
+  private async searchReddit(query: string, sinceTime: number): Promise<ScrapedPost[]> {
     const posts: ScrapedPost[] = []
     const encodedQuery = encodeURIComponent(query)
     const path = `/search.rss?q=${encodedQuery}&sort=new&limit=100`
     const items = await fetchRedditRss(path)
 
     for (const item of items) {
-      const pubDateText = getTextValue(item.pubDate) || getTextValue(item.published) || getTextValue(item.updated)
-      const createdAt = pubDateText ? new Date(pubDateText) : null
-
-      if (!createdAt) {
-        continue
-      }
+      const publishedTime = getPublishedTime(item)
 
-      // Skip posts older than since
-      if (createdAt.getTime() / 1000 < sinceTimestamp) {
+      // Skip undated posts and posts older than since
+      if (publishedTime === null || publishedTime < sinceTime) {
         continue
       }
 
-      const scrapedPost = toScrapedPost(item)
+      const scrapedPost = toScrapedPost(item, readItemContent(item), publishedTime)
       if (scrapedPost) {
         posts.push(scrapedPost)
       }
@@ -168,10 +168,16 @@ export class ScraperRegistry {
       )
     )
 
-    // Collect successful results
+    // Drop duplicate source:sourceId pairs so a post is analyzed once per run
+    const seenPosts = new Set<string>()
     for (const result of results) {
       if (result.status === 'fulfilled') {
-        allPosts.push(...result.value)
+        for (const post of result.value) {
+          const key = `${post.source}:${post.sourceId}`
+          if (seenPosts.has(key)) continue
+          seenPosts.add(key)
+          allPosts.push(post)
+        }
       }
     }
 
@@ -38,11 +38,12 @@ export interface UploadResult {
 
 export async function uploadScrapedImage(
   imageUrl: string,
-  plateNumber: string
+  plateNumber: string,
+  imageBuffer?: Buffer
 ): Promise<UploadResult> {
   try {
-    // Download the image
-    const imageBuffer = await downloadImage(imageUrl)
+    // Reuse the already-downloaded image when the caller has it
+    const imageData = imageBuffer ?? await downloadImage(imageUrl)
 
     // Generate filename
     const filename = generateFilename(plateNumber, imageUrl)
@@ -52,7 +53,7 @@ export async function uploadScrapedImage(
     const supabase = getSupabaseClient()
     const { data, error } = await supabase.storage
       .from(STORAGE_BUCKET)
-      .upload(filename, imageBuffer, {
+      .upload(filename, imageData, {
         contentType: mimeType,
         upsert: false,
       })
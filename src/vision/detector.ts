@@ -1,4 +1,4 @@
-import { analyzeImageWithPrompt, parseJsonResponse } from './gemini.js'
+import { GeminiRateLimitError, analyzeImageWithPrompt, parseJsonResponse } from './gemini.js'
 import { logger } from '../utils/logger.js'
 
 export interface DetectionResult {
@@ -83,6 +83,7 @@ export async function detectRobotaxi(imageUrl: string): Promise<DetectionResult>
 
     return parsed
   } catch (error) {
+    if (error instanceof GeminiRateLimitError) throw error
     logger.error({ error, imageUrl }, 'Detection failed')
     return defaultResult
   }
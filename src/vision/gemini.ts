@@ -1,15 +1,37 @@
-import { GoogleGenerativeAI, GenerativeModel } from '@google/generative-ai'
+import { createHash } from 'crypto'
+import type { GenerativeModel } from '@google/generative-ai'
 import { config } from '../config/index.js'
 import { logger } from '../utils/logger.js'
 import { downloadImage } from '../scrapers/http.js'
+import { delay } from '../utils/delay.js'
+
+const GEMINI_MODEL = 'gemini-2.0-flash'
+const MAX_CACHED_RESPONSES = 500
+
+// Per-minute 429s usually clear within a minute, so wait them out a few
+// times before giving up; longer waits are treated as an exhausted quota
+const MAX_RATE_LIMIT_RETRIES = 3
+const DEFAULT_RATE_LIMIT_DELAY_MS = 15000
+const MAX_RATE_LIMIT_DELAY_MS = 60000
 
-let genAI: GoogleGenerativeAI | null = null
 let model: GenerativeModel | null = null
 
-function getModel(): GenerativeModel {
+// Successful analyses keyed by SHA-256 of model, prompt and image URL. The
+// same image is often linked from several posts (crossposts, search results),
+// and in-flight requests are shared so concurrent posts don't duplicate calls.
+const responseCache = new Map<string, Promise<GeminiResponse>>()
+
+// The SDK is only loaded once an image actually needs analysis, so runs that
+// collect no posts never pay for importing it.
+async function getModel(): Promise<GenerativeModel> {
   if (!model) {
-    genAI = new GoogleGenerativeAI(config.geminiApiKey)
-    model = genAI.getGenerativeModel({ model: 'gemini-2.0-flash' })
+    const { GoogleGenerativeAI } = await import('@google/generative-ai')
+    const genAI = new GoogleGenerativeAI(config.geminiApiKey)
+    model = genAI.getGenerativeModel({
+      model: GEMINI_MODEL,
+      // Every prompt asks for JSON; JSON mode skips markdown fences and prose
+      generationConfig: { responseMimeType: 'application/json' },
+    })
   }
   return model
 }
@@ -19,12 +41,96 @@ export interface GeminiResponse {
   success: boolean
 }
 
+// Thrown once retries are used up (or the quota is exhausted) instead of
+// returning a failed response, so the image isn't treated as analyzed
+export class GeminiRateLimitError extends Error {
+  constructor(message: string, readonly quotaExhausted: boolean) {
+    super(message)
+    this.name = 'GeminiRateLimitError'
+  }
+}
+
+interface RateLimitInfo {
+  retryDelayMs: number | null
+  quotaExhausted: boolean
+}
+
+interface GeminiErrorDetail {
+  '@type'?: string
+  retryDelay?: string
+  violations?: Array<{ quotaId?: string }>
+}
+
+function isRateLimitError(error: unknown): boolean {
+  return typeof error === 'object' && error !== null && (error as { status?: number }).status === 429
+}
+
+// Read RetryInfo and QuotaFailure from the SDK error's details. A daily quota
+// won't reset within the run, so it is reported as exhausted.
+function getRateLimitInfo(error: unknown): RateLimitInfo {
+  const details = (error as { errorDetails?: GeminiErrorDetail[] }).errorDetails ?? []
+  let retryDelayMs: number | null = null
+  let quotaExhausted = false
+
+  for (const detail of details) {
+    const type = detail['@type'] ?? ''
+    if (type.endsWith('RetryInfo') && detail.retryDelay) {
+      const seconds = parseFloat(detail.retryDelay)
+      if (!Number.isNaN(seconds)) {
+        retryDelayMs = Math.ceil(seconds * 1000)
+      }
+    } else if (type.endsWith('QuotaFailure')) {
+      quotaExhausted ||= (detail.violations ?? []).some(v => v.quotaId?.includes('PerDay'))
+    }
+  }
+
+  if (retryDelayMs !== null && retryDelayMs > MAX_RATE_LIMIT_DELAY_MS) {
+    quotaExhausted = true
+  }
+
+  return { retryDelayMs, quotaExhausted }
+}
+
+function getCacheKey(imageUrl: string, prompt: string): string {
+  return createHash('sha256')
+    .update(`${GEMINI_MODEL}|${prompt}|${imageUrl}`)
+    .digest('hex')
+}
+
 export async function analyzeImageWithPrompt(
   imageUrl: string,
   prompt: string
 ): Promise<GeminiResponse> {
+  const key = getCacheKey(imageUrl, prompt)
+  const cached = responseCache.get(key)
+  if (cached) {
+    logger.debug({ imageUrl }, 'Using cached Gemini response')
+    return cached
+  }
+
+  const pending = requestAnalysis(imageUrl, prompt)
+  responseCache.set(key, pending)
+
+  const response = await pending.catch((error: unknown) => {
+    responseCache.delete(key)
+    throw error
+  })
+  if (!response.success) {
+    // Only cache successes so transient failures are retried
+    responseCache.delete(key)
+  } else if (responseCache.size > MAX_CACHED_RESPONSES) {
+    const oldestKey = responseCache.keys().next().value
+    if (oldestKey !== undefined) {
+      responseCache.delete(oldestKey)
+    }
+  }
+
+  return response
+}
+
+async function requestAnalysis(imageUrl: string, prompt: string): Promise<GeminiResponse> {
   try {
-    const model = getModel()
+    const model = await getModel()
 
     // Download image and convert to base64
     const imageBuffer = await downloadImage(imageUrl)
@@ -38,28 +144,55 @@ export async function analyzeImageWithPrompt(
       mimeType = 'image/webp'
     }
 
-    // Create content with image
-    const result = await model.generateContent([
-      {
-        inlineData: {
-          mimeType,
-          data: base64Image,
-        },
-      },
-      { text: prompt },
-    ])
-
-    const response = await result.response
-    const text = response.text()
-
-    return { text, success: true }
+    for (let attempt = 1; ; attempt++) {
+      try {
+        // Create content with image
+        const result = await model.generateContent([
+          {
+            inlineData: {
+              mimeType,
+              data: base64Image,
+            },
+          },
+          { text: prompt },
+        ])
+
+        const response = await result.response
+        const text = response.text()
+
+        return { text, success: true }
+      } catch (error) {
+        if (!isRateLimitError(error)) throw error
+
+        const { retryDelayMs, quotaExhausted } = getRateLimitInfo(error)
+        if (quotaExhausted || attempt > MAX_RATE_LIMIT_RETRIES) {
+          const message = error instanceof Error ? error.message : 'Gemini rate limit exceeded'
+          throw new GeminiRateLimitError(message, quotaExhausted)
+        }
+
+        const waitMs = retryDelayMs ?? DEFAULT_RATE_LIMIT_DELAY_MS * attempt
+        logger.warn({ imageUrl, attempt, waitMs }, 'Gemini rate limited, waiting...')
+        await delay(waitMs)
+      }
+    }
   } catch (error) {
+    if (error instanceof GeminiRateLimitError) throw error
     logger.error({ error, imageUrl }, 'Gemini analysis failed')
     return { text: '', success: false }
   }
 }
 
 export function parseJsonResponse<T>(text: string): T | null {
+  // Fast path: JSON mode responses are usually a bare JSON object
+  try {
+    const parsed: unknown = JSON.parse(text)
+    if (parsed && typeof parsed === 'object' && !Array.isArray(parsed)) {
+      return parsed as T
+    }
+  } catch {
+    // Fall back to extracting the object from a wrapped response
+  }
+
   try {
     // Try to extract JSON from the response (may be wrapped in markdown code blocks)
     let jsonStr = text
@@ -1,4 +1,4 @@
-import { analyzeImageWithPrompt, parseJsonResponse } from './gemini.js'
+import { GeminiRateLimitError, analyzeImageWithPrompt, parseJsonResponse } from './gemini.js'
 import { logger } from '../utils/logger.js'
 import { validateAndCleanPlate, type VehicleProvider } from '../utils/validation.js'
 
@@ -94,6 +94,7 @@ export async function extractPlate(
 
     return parsed
   } catch (error) {
+    if (error instanceof GeminiRateLimitError) throw error
     logger.error({ error, imageUrl }, 'Plate extraction failed')
     return defaultResult
   }